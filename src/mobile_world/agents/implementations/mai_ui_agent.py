@@ -151,7 +151,9 @@ class MAIUINaivigationAgent(MCPAgent):
         self.history_n = self.runtime_conf["history_n"]
 
         # History tracking
-        self.history_images: list[tuple[Any, Any, Any]] = []  # (image, tool_call, ask_user_response)
+        self.history_images: list[
+            tuple[Any, Any, Any]
+        ] = []  # (image, tool_call, ask_user_response)
         self.history_responses: list[dict] = []
 
     @property
@@ -159,9 +161,7 @@ class MAIUINaivigationAgent(MCPAgent):
         """Generate the system prompt based on available MCP tools."""
         mcp_tools_str = None
         if self.tools:
-            mcp_tools_str = "\n".join(
-                [json.dumps(tool, ensure_ascii=False) for tool in self.tools]
-            )
+            mcp_tools_str = "\n".join([json.dumps(tool, ensure_ascii=False) for tool in self.tools])
         return MAI_MOBILE_SYS_PROMPT_ASK_USER_MCP.render(tools=mcp_tools_str)
 
     def initialize_hook(self, instruction: str) -> None:
@@ -187,10 +187,12 @@ class MAIUINaivigationAgent(MCPAgent):
             encoded_string = pil_to_base64(img_data)
             return {
                 "role": "user",
-                "content": [{
-                    "type": "image_url",
-                    "image_url": {"url": f"data:image/png;base64,{encoded_string}"},
-                }],
+                "content": [
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": f"data:image/png;base64,{encoded_string}"},
+                    }
+                ],
             }
 
     def _hide_history_images(self, messages: list[dict]) -> list[dict]:
@@ -304,7 +306,7 @@ class MAIUINaivigationAgent(MCPAgent):
         except Exception as e:
             logger.error(f"Error parsing LLM response: {e}")
             traceback.print_exc()
-            return "Parsing error", JSONAction(action_type=UNKNOWN, text=str(e))
+            return "Parsing error", JSONAction.from_trusted(action_type=UNKNOWN, text=str(e))
         self.history_responses.append({"role": "assistant", "content": prediction})
 
         json_action = self._convert_to_json_action(tool_name, action_json, obs_image)
@@ -315,9 +317,7 @@ class MAIUINaivigationAgent(MCPAgent):
         assert isinstance(obs_image, Image.Image)
         return obs_image.size
 
-    def _normalize_coord_to_pixel(
-        self, coord: list[float], obs_image: Any
-    ) -> tuple[int, int]:
+    def _normalize_coord_to_pixel(self, coord: list[float], obs_image: Any) -> tuple[int, int]:
         width, height = self._get_image_size(obs_image)
         return int(coord[0] * width), int(coord[1] * height)
 
@@ -356,16 +356,18 @@ class MAIUINaivigationAgent(MCPAgent):
             end_x, end_y = self._normalize_coord_to_pixel(end_coord, obs_image)
             return JSONAction(
                 action_type=DRAG,
-                start_x=start_x, start_y=start_y,
-                end_x=end_x, end_y=end_y,
+                start_x=start_x,
+                start_y=start_y,
+                end_x=end_x,
+                end_y=end_y,
             )
 
         if action_type == "system_button":
             button = action_json.get("button", "").lower()
             button_map = {"back": NAVIGATE_BACK, "home": NAVIGATE_HOME, "enter": KEYBOARD_ENTER}
             if button in button_map:
-                return JSONAction(action_type=button_map[button])
-            return JSONAction(action_type=UNKNOWN, text=f"Unknown button: {button}")
+                return JSONAction.from_trusted(action_type=button_map[button])
+            return JSONAction.from_trusted(action_type=UNKNOWN, text=f"Unknown button: {button}")
 
         if action_type == "type":
             return JSONAction(action_type=INPUT_TEXT, text=action_json.get("text", ""))
@@ -383,9 +385,9 @@ class MAIUINaivigationAgent(MCPAgent):
             return JSONAction(action_type=ASK_USER, text=action_json.get("text", ""))
 
         if action_type == "wait":
-            return JSONAction(action_type=WAIT)
+            return JSONAction.from_trusted(action_type=WAIT)
 
-        return JSONAction(action_type=UNKNOWN, text=f"Unknown action: {action_type}")
+        return JSONAction.from_trusted(action_type=UNKNOWN, text=f"Unknown action: {action_type}")
 
     def reset(self) -> None:
         """Reset the agent for the next task."""
@@ -322,7 +322,7 @@ class PlannerExecutorAgentMCP(MCPAgent):
         if plan is None:
             raise ValueError("Planner LLM failed")
         if action_str is None:
-            return "Planner LLM failed", JSONAction(
+            return "Planner LLM failed", JSONAction.from_trusted(
                 action_type="unknown", text="Planner LLM failed"
             )
 
@@ -330,7 +330,7 @@ class PlannerExecutorAgentMCP(MCPAgent):
             json_action_dict = parsing_planner_response_to_android_world_env_action(action_str)
         except Exception as e:
             logger.error(f"Error parsing planner response: {e}")
-            return "Planner LLM failed", JSONAction(
+            return "Planner LLM failed", JSONAction.from_trusted(
                 action_type="unknown", text="Planner LLM failed"
             )
 
@@ -297,7 +297,9 @@ class Qwen3VLAgentMCP(MCPAgent):
                     try_times -= 1
 
         if parsed_response is None:
-            return "llm parse error after multiple retries", JSONAction(action_type=ENV_FAIL)
+            return "llm parse error after multiple retries", JSONAction.from_trusted(
+                action_type=ENV_FAIL
+            )
 
         self.history_responses.append(prediction)
         self.thoughts.append(parsed_response["thinking"])
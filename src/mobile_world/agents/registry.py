@@ -96,7 +96,7 @@ def load_agent_from_file(file_path: str) -> type[BaseAgent]:
 
 
 def create_agent(
-    agent_type: str, model_name: str, llm_base_url: str, api_key: str = 'empty', **kwargs
+    agent_type: str, model_name: str, llm_base_url: str, api_key: str = "empty", **kwargs
 ):
     """Create an agent instance based on the agent type.
 
@@ -142,7 +142,7 @@ def create_agent(
             model_name=model_name,
             llm_base_url=llm_base_url,
             tools=kwargs["env"].tools,
-            api_key=os.getenv("API_KEY", "empty"),
+            api_key=api_key or "empty",
         )
     elif agent_type == "planner_executor":
         return agent_class(
@@ -172,4 +172,4 @@ def create_agent(
             runtime_conf=config["runtime_conf"],
             scale_factor=scale_factor,
             **kwargs,
-        )
\ No newline at end of file
+        )
@@ -332,7 +332,9 @@ def launch_containers(
     if dev_mode and count > 1:
         raise ValueError("Dev mode only supports launching a single container")
 
-    port_sets = find_available_ports(backend_start_port, viewer_start_port, vnc_start_port, adb_start_port, count)
+    port_sets = find_available_ports(
+        backend_start_port, viewer_start_port, vnc_start_port, adb_start_port, count
+    )
 
     if len(port_sets) < count:
         logger.warning(f"Could only find {len(port_sets)} available port sets out of {count}")
@@ -371,6 +373,7 @@ def list_containers(
     image_filter: str = DEFAULT_IMAGE,
     name_prefix: str | None = DEFAULT_NAME_PREFIX,
     include_all: bool = False,
+    running_only: bool = False,
 ) -> list[ContainerInfo]:
     """List MobileWorld containers.
 
@@ -378,11 +381,14 @@ def list_containers(
         image_filter: Filter by image name
         name_prefix: Filter by name prefix
         include_all: Include stopped containers
+        running_only: Only return running containers (filtered by Docker itself)
 
     Returns:
         List of ContainerInfo objects
     """
-    containers = list_containers_by_image_substring(image_filter, include_all=include_all)
+    containers = list_containers_by_image_substring(
+        image_filter, include_all=include_all, running_only=running_only
+    )
 
     result = []
     for container in containers:
@@ -2,6 +2,7 @@ import os
 import random
 import threading
 import time
+from collections.abc import Sequence
 from queue import Queue
 
 from dotenv import load_dotenv
@@ -236,9 +237,9 @@ def run_agent_with_evaluation(
     model_name: str,
     llm_base_url: str,
     log_file_root: str,
-    tasks: list[str],
+    tasks: Sequence[str],
     max_step: int = -1,
-    aw_urls: list[str] | None = None,
+    aw_urls: Sequence[str] | None = None,
     api_key: str | None = None,
     device: str = "emulator-5554",
     step_wait_time: float = 1.0,
@@ -258,9 +259,9 @@ def run_agent_with_evaluation(
         model_name: Model name for the agent
         llm_base_url: LLM service base URL
         log_file_root: Root directory for log files
-        tasks: List of task names to execute (empty list for all tasks)
+        tasks: Task names to execute (empty for all tasks)
         max_step: Maximum steps for task execution
-        aw_urls: List of Android World backend URLs. If None, auto-discover from containers
+        aw_urls: Android World backend URLs. If None, auto-discover from containers
         api_key: API key for LLM service
         device: Android device ID
         step_wait_time: Wait time after each step
@@ -291,7 +292,7 @@ def run_agent_with_evaluation(
     )
 
     if len(tasks) != 0:
-        task_list = tasks
+        task_list = list(tasks)
     else:
         task_list = envs[0].get_suite_task_list(enable_mcp=enable_mcp)
 
@@ -5,10 +5,14 @@ import json
 import sys
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import filterfalse
+from operator import attrgetter
 from pathlib import Path
 
 from rich import box
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
@@ -40,6 +44,11 @@ from mobile_world.runtime.utils.docker import (
 # Create a Rich console instance for better terminal output
 console = Console()
 
+# Shared Panel styles for the most common message kinds
+_ERROR_PANEL_KW = {"title": "[red]✗ Error[/red]", "border_style": "red"}
+_WARNING_PANEL_KW = {"title": "[yellow]⚠ Warning[/yellow]", "border_style": "yellow"}
+_INFO_PANEL_KW = {"title": "[yellow]ℹ Info[/yellow]", "border_style": "yellow"}
+
 
 def _add_common_options(
     parser: argparse.ArgumentParser, *, image: bool = False, prefix: bool = False
@@ -331,14 +340,17 @@ def _launch_containers(args: argparse.Namespace) -> None:
             Panel(
                 "[red]Dev mode only supports launching a single container.[/red]\n"
                 "[yellow]Please use --count 1 or omit --count when using --dev[/yellow]",
-                title="[red]✗ Error[/red]",
-                border_style="red",
+                **_ERROR_PANEL_KW,
             )
         )
         sys.exit(1)
 
     port_sets = find_available_ports(
-        args.backend_start_port, args.viewer_start_port, args.vnc_start_port, args.adb_start_port, count
+        args.backend_start_port,
+        args.viewer_start_port,
+        args.vnc_start_port,
+        args.adb_start_port,
+        count,
     )
 
     if len(port_sets) < count:
@@ -368,8 +380,7 @@ def _launch_containers(args: argparse.Namespace) -> None:
                 console.print(
                     Panel(
                         f"[yellow]src directory not found at {dev_src_path}[/yellow]",
-                        title="[yellow]⚠ Warning[/yellow]",
-                        border_style="yellow",
+                        **_WARNING_PANEL_KW,
                     )
                 )
                 dev_src_path = None
@@ -385,8 +396,7 @@ def _launch_containers(args: argparse.Namespace) -> None:
             console.print(
                 Panel(
                     "[yellow]Could not find project root (pyproject.toml). Dev mode disabled.[/yellow]",
-                    title="[yellow]⚠ Warning[/yellow]",
-                    border_style="yellow",
+                    **_WARNING_PANEL_KW,
                 )
             )
 
@@ -409,8 +419,7 @@ def _launch_containers(args: argparse.Namespace) -> None:
             console.print(
                 Panel(
                     f"[red]Environment file not found: {env_file_path}[/red]",
-                    title="[red]✗ Error[/red]",
-                    border_style="red",
+                    **_ERROR_PANEL_KW,
                 )
             )
             sys.exit(1)
@@ -418,8 +427,7 @@ def _launch_containers(args: argparse.Namespace) -> None:
             console.print(
                 Panel(
                     f"[red]Path is not a file: {env_file_path}[/red]",
-                    title="[red]✗ Error[/red]",
-                    border_style="red",
+                    **_ERROR_PANEL_KW,
                 )
             )
             sys.exit(1)
@@ -435,8 +443,7 @@ def _launch_containers(args: argparse.Namespace) -> None:
             Panel(
                 "[red]No .env file found in current directory and --env-file not specified[/red]\n"
                 "[yellow]Please provide --env-file argument with path to .env file[/yellow]",
-                title="[red]✗ Error[/red]",
-                border_style="red",
+                **_ERROR_PANEL_KW,
             )
         )
         sys.exit(1)
@@ -623,8 +630,7 @@ def _launch_containers(args: argparse.Namespace) -> None:
                 console.print(
                     Panel(
                         f"[yellow]Container '{container['name']}' did not become ready in time[/yellow]",
-                        title="[yellow]⚠ Warning[/yellow]",
-                        border_style="yellow",
+                        **_WARNING_PANEL_KW,
                     )
                 )
 
@@ -688,8 +694,7 @@ def _destroy_containers(args: argparse.Namespace) -> None:
         console.print(
             Panel(
                 "[yellow]No containers to destroy[/yellow]",
-                title="[yellow]ℹ Info[/yellow]",
-                border_style="yellow",
+                **_INFO_PANEL_KW,
             )
         )
         return
@@ -725,8 +730,7 @@ def _list_containers(args: argparse.Namespace) -> None:
         console.print(
             Panel(
                 "[yellow]No MobileWorld containers found[/yellow]",
-                title="[yellow]ℹ Info[/yellow]",
-                border_style="yellow",
+                **_INFO_PANEL_KW,
             )
         )
         return
@@ -785,8 +789,7 @@ def _info_container(args: argparse.Namespace) -> None:
         console.print(
             Panel(
                 f"[red]Container '{container_name}' not found[/red]",
-                title="[red]✗ Error[/red]",
-                border_style="red",
+                **_ERROR_PANEL_KW,
             )
         )
         return
@@ -909,13 +912,19 @@ def _restart_single_container(container_name: str, interactive: bool = False) ->
             console.print(
                 Panel(
                     "[red]✗ Failed to start server[/red]",
-                    title="[red]✗ Error[/red]",
-                    border_style="red",
+                    **_ERROR_PANEL_KW,
                 )
             )
             return False
 
 
+def _restart_container_quietly(container_name: str) -> bool:
+    """Kill and restart the MobileWorld server in a container without console output."""
+    if not kill_server_in_container(container_name):
+        return False
+    return restart_server_in_container(container_name, detach=True, enable_mcp=True)
+
+
 def _restart_server(args: argparse.Namespace) -> None:
     """Restart the MobileWorld server in container(s)."""
     if args.container_name:
@@ -928,25 +937,22 @@ def _restart_server(args: argparse.Namespace) -> None:
             console.print(
                 Panel(
                     "[red]Interactive mode (-i) is not supported when restarting multiple containers[/red]",
-                    title="[red]✗ Error[/red]",
-                    border_style="red",
+                    **_ERROR_PANEL_KW,
                 )
             )
             sys.exit(1)
 
-        containers = list_containers(
+        running_containers = list_containers(
             image_filter=args.image,
             name_prefix=args.name_prefix,
-            include_all=False,
+            running_only=True,
         )
-        running_containers = [c for c in containers if c.running]
 
         if not running_containers:
             console.print(
                 Panel(
                     f"[yellow]No running containers found matching prefix '{args.name_prefix}'[/yellow]",
-                    title="[yellow]ℹ Info[/yellow]",
-                    border_style="yellow",
+                    **_INFO_PANEL_KW,
                 )
             )
             return
@@ -959,11 +965,61 @@ def _restart_server(args: argparse.Namespace) -> None:
             )
         )
 
+        # Restarts are I/O bound (docker exec + sleeps), so run them concurrently.
+        # Workers stay silent; all console output happens on the main thread.
         success_count = 0
-        for c in running_containers:
+        # Container name -> failure reason (empty when the restart just reported failure)
+        failed: dict[str, str] = {}
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[cyan]{task.completed}/{task.total}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task(
+                "[cyan]Restarting servers...[/cyan]", total=len(running_containers)
+            )
+            with ThreadPoolExecutor(max_workers=min(8, len(running_containers))) as executor:
+                futures = {
+                    executor.submit(_restart_container_quietly, c.name): c.name
+                    for c in running_containers
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    reason = ""
+                    try:
+                        ok = future.result()
+                    except Exception as e:
+                        ok = False
+                        reason = f"{type(e).__name__}: {e}"
+                    if ok:
+                        success_count += 1
+                    else:
+                        failed[name] = reason
+                    # Report through the live bar (refreshed at a fixed rate) rather than
+                    # one console write per container; failures are summarized below.
+                    progress.update(
+                        task,
+                        advance=1,
+                        description=f"[cyan]Restarting servers...[/cyan] [dim]{name}[/dim]",
+                    )
+                progress.update(task, description="[green]✓ Restart finished[/green]")
+
+        if failed:
             console.print()
-            if _restart_single_container(c.name, interactive=False):
-                success_count += 1
+            console.print(
+                Panel(
+                    f"[red]✗ Failed to restart {len(failed)} container(s)[/red]\n"
+                    + "\n".join(
+                        f"[dim]- {name}[/dim]"
+                        + (f" [red]{escape(failed[name])}[/red]" if failed[name] else "")
+                        for name in sorted(failed)
+                    ),
+                    title="[red]✗ Errors[/red]",
+                    border_style="red",
+                )
+            )
 
         console.print()
         console.print(
@@ -991,6 +1047,17 @@ def _exec_container(args: argparse.Namespace) -> None:
     docker_exec_replace(container_name, command, interactive=True)
 
 
+# Placeholder values shipped in .env.example
+_ENV_PLACEHOLDERS: dict[str, str] = {
+    "API_KEY": "your_api_key_for_agent_model",
+    "DASHSCOPE_API_KEY": "dashscope_api_key_for_mcp",
+    "MODELSCOPE_API_KEY": "modelscope_api_key_for_mcp",
+    "USER_AGENT_API_KEY": "your_user_agent_llm_api_key",
+    "USER_AGENT_BASE_URL": "your_user_agent_base_url",
+}
+_ENV_PLACEHOLDER_ITEMS: frozenset[tuple[str, str]] = frozenset(_ENV_PLACEHOLDERS.items())
+
+
 def _check_env_file() -> tuple[bool, str, str | None]:
     """Check if .env file exists and has valid configuration.
 
@@ -1021,54 +1088,40 @@ def _check_env_file() -> tuple[bool, str, str | None]:
     issues = []
     warnings = []
 
-    # Define placeholder values to check against
-    placeholders = {
-        "API_KEY": "your_api_key_for_agent_model",
-        "DASHSCOPE_API_KEY": "dashscope_api_key_for_mcp",
-        "MODELSCOPE_API_KEY": "modelscope_api_key_for_mcp",
-        "USER_AGENT_API_KEY": "your_user_agent_llm_api_key",
-        "USER_AGENT_BASE_URL": "your_user_agent_base_url",
-    }
-
-    def is_valid(key: str) -> bool:
-        """Check if env var exists and is not a placeholder."""
+    mcp_keys = ["DASHSCOPE_API_KEY", "MODELSCOPE_API_KEY"]
+    user_agent_keys = ["USER_AGENT_API_KEY", "USER_AGENT_BASE_URL", "USER_AGENT_MODEL"]
+
+    # Classify every key of interest in a single pass: "missing", "placeholder" or "ok"
+    status: dict[str, str] = {}
+    for key in ["API_KEY", *mcp_keys, *user_agent_keys]:
         value = env_vars.get(key)
         if not value:
-            return False
-        if value == placeholders.get(key):
-            return False
-        return True
+            status[key] = "missing"
+        elif (key, value) in _ENV_PLACEHOLDER_ITEMS:
+            status[key] = "placeholder"
+        else:
+            status[key] = "ok"
 
     # 1. Check API_KEY (required for all tasks)
-    if not is_valid("API_KEY"):
-        if env_vars.get("API_KEY") == placeholders["API_KEY"]:
-            issues.append("API_KEY is still set to placeholder value")
-        else:
-            issues.append("API_KEY is missing (required for all tasks)")
+    if status["API_KEY"] == "placeholder":
+        issues.append("API_KEY is still set to placeholder value")
+    elif status["API_KEY"] == "missing":
+        issues.append("API_KEY is missing (required for all tasks)")
 
     # 2. Check MCP keys (optional - for MCP tasks)
-    mcp_keys_missing = []
-    mcp_keys_placeholder = []
-    for key in ["DASHSCOPE_API_KEY", "MODELSCOPE_API_KEY"]:
-        if env_vars.get(key) == placeholders.get(key):
-            mcp_keys_placeholder.append(key)
-        elif not env_vars.get(key):
-            mcp_keys_missing.append(key)
+    mcp_keys_placeholder = [k for k in mcp_keys if status[k] == "placeholder"]
+    mcp_keys_missing = [k for k in mcp_keys if status[k] == "missing"]
 
     if mcp_keys_placeholder:
-        warnings.append(f"{', '.join(mcp_keys_placeholder)}: placeholder value (required for MCP tasks)")
+        warnings.append(
+            f"{', '.join(mcp_keys_placeholder)}: placeholder value (required for MCP tasks)"
+        )
     if mcp_keys_missing:
         warnings.append(f"{', '.join(mcp_keys_missing)}: not set (required for MCP tasks)")
 
     # 3. Check USER_AGENT_* keys (optional - for agent-user interaction tasks)
-    user_agent_keys = ["USER_AGENT_API_KEY", "USER_AGENT_BASE_URL", "USER_AGENT_MODEL"]
-    user_agent_missing = []
-    user_agent_placeholder = []
-    for key in user_agent_keys:
-        if env_vars.get(key) == placeholders.get(key):
-            user_agent_placeholder.append(key)
-        elif not env_vars.get(key):
-            user_agent_missing.append(key)
+    user_agent_placeholder = [k for k in user_agent_keys if status[k] == "placeholder"]
+    user_agent_missing = [k for k in user_agent_keys if status[k] == "missing"]
 
     if user_agent_placeholder:
         warnings.append(
@@ -1137,7 +1190,7 @@ def _check_prerequisites(args: argparse.Namespace) -> None:
     console.print(table)
 
     # Print details for failed checks
-    failed_checks = [c for c in results.checks if not c.passed]
+    failed_checks = list(filterfalse(attrgetter("passed"), results.checks))
     if failed_checks:
         console.print()
         console.print(
@@ -1265,19 +1318,20 @@ def _offer_image_pull(image: str) -> None:
         console.print("\n[dim]Cancelled.[/dim]")
 
 
+_ACTION_MAP: dict[str, Callable[[argparse.Namespace], None]] = {
+    "run": _launch_containers,
+    "rm": _destroy_containers,
+    "list": _list_containers,
+    "ls": _list_containers,
+    "info": _info_container,
+    "restart": _restart_server,
+    "exec": _exec_container,
+    "check": _check_prerequisites,
+}
+
+
 async def execute(args: argparse.Namespace) -> None:
     """Execute the env command."""
-    action_map: dict[str, Callable] = {
-        "run": _launch_containers,
-        "rm": _destroy_containers,
-        "list": _list_containers,
-        "ls": _list_containers,
-        "info": _info_container,
-        "restart": _restart_server,
-        "exec": _exec_container,
-        "check": _check_prerequisites,
-    }
-
-    action = action_map.get(args.env_action)
+    action = _ACTION_MAP.get(args.env_action)
     if action:
         action(args)
@@ -3,9 +3,11 @@
 import argparse
 import json
 import os
+import sys
 import time
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from loguru import logger
 from rich.console import Console
@@ -15,6 +17,25 @@ from rich.text import Text
 
 from ..runner import run_agent_with_evaluation
 
+try:
+    import orjson
+except ImportError:  # orjson is optional (pulled in by gradio); fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+# Maximum number of per-task rows rendered in the results table
+MAX_RESULT_TABLE_ROWS = 50
+# Write buffer for the JSON report; keeps large reports to a handful of write() calls
+REPORT_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _task_selection(value: str) -> str:
+    """Reject a --task value that names no task, e.g. "," or an empty string."""
+    if not any(value.split(",")):
+        raise argparse.ArgumentTypeError(
+            'expected task name(s), comma-separated, or "ALL" to run all tasks'
+        )
+    return value
+
 
 def _add_common_arguments(parser: argparse.ArgumentParser) -> None:
     """Add common arguments shared between eval and test commands."""
@@ -151,6 +172,7 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
         "--task",
         "--tasks",
         dest="task",
+        type=_task_selection,
         help='Specific task(s) to run (comma-separated) or "ALL" to run all tasks and generate statistics',
     )
     eval_parser.add_argument(
@@ -182,6 +204,50 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Shuffle the order of tasks before running",
     )
+    eval_parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Skip the rich summary output (the JSON report is still written)",
+    )
+    eval_parser.add_argument(
+        "--json",
+        action="store_true",
+        dest="json_output",
+        help="Print the report summary as JSON instead of rich output",
+    )
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON with orjson when available, else the stdlib encoder."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _write_report(report_file: Path, report: dict[str, Any]) -> None:
+    """Write the evaluation report as JSON, streaming list sections item by item.
+
+    Scalar sections (summary, metadata) are indented as usual, while each entry of a
+    list section is serialized on its own line so large ALL-task runs never need an
+    indented copy of every task result in memory. Encoded bytes go straight into a
+    1 MiB write buffer.
+    """
+    with report_file.open("wb", buffering=REPORT_WRITE_BUFFER_SIZE) as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(report.items()):
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(_dumps(key) + b": ")
+            if isinstance(value, list):
+                f.write(b"[")
+                for j, item in enumerate(value):
+                    f.write(b",\n    " if j else b"\n    ")
+                    f.write(_dumps(item))
+                f.write(b"\n  ]" if value else b"]")
+            else:
+                f.write(_dumps(value, indent=True).replace(b"\n", b"\n  "))
+        f.write(b"\n}\n")
 
 
 async def execute(args: argparse.Namespace) -> None:
@@ -191,15 +257,16 @@ async def execute(args: argparse.Namespace) -> None:
     # Check if running all tasks
     run_all_tasks = args.task and args.task.upper() == "ALL"
     if run_all_tasks:
-        final_tasks = []
+        final_tasks: tuple[str, ...] = ()
         logger.info("Running ALL tasks with statistics generation")
     else:
-        final_tasks = args.task.split(",") if args.task else []
+        # Drop empty entries (e.g. from a trailing comma) while splitting
+        final_tasks = tuple(filter(None, args.task.split(","))) if args.task else ()
 
-    start_time = time.time() if run_all_tasks else None
+    start_time = time.perf_counter() if run_all_tasks else None
 
     # Parse aw_host URLs - if None, will auto-discover; if provided, split by comma
-    aw_urls = None if args.aw_host is None else args.aw_host.split(",")
+    aw_urls = None if args.aw_host is None else tuple(args.aw_host.split(","))
 
     task_results, task_list_with_no_results = run_agent_with_evaluation(
         agent_type=args.agent_type,
@@ -225,11 +292,20 @@ async def execute(args: argparse.Namespace) -> None:
         scale_factor=getattr(args, "scale_factor", 1000),
     )
     if run_all_tasks and task_results:
-        total_duration = time.time() - start_time
+        total_duration = time.perf_counter() - start_time
+        now = datetime.now()
 
         total_tasks = len(task_results)
 
-        successful_tasks = sum(1 for result in task_results if result["score"] > 0.99)
+        # Single pass: count successes and collect the rows shown in the results table
+        successful_tasks = 0
+        result_rows: list[tuple[str, str, bool]] = []
+        for result in task_results:
+            score = result["score"]
+            success = score > 0.99
+            successful_tasks += success
+            if len(result_rows) < MAX_RESULT_TABLE_ROWS:
+                result_rows.append((result.get("task_name", "Unknown"), f"{score:.3f}", success))
         overall_success_rate = successful_tasks / total_tasks if total_tasks > 0 else 0.0
 
         report = {
@@ -244,7 +320,7 @@ async def execute(args: argparse.Namespace) -> None:
             "metadata": {
                 "agent_type": args.agent_type,
                 "model_name": args.model_name,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "log_file_root": log_file_root,
             },
             "tasks_with_results": task_results,
@@ -253,23 +329,32 @@ async def execute(args: argparse.Namespace) -> None:
 
         output_path = Path(log_file_root)
         output_path.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         report_file = output_path / f"eval_report_{timestamp}.json"
 
-        with open(report_file, "w") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        _write_report(report_file, report)
+
+        if args.json_output:
+            output = {
+                "summary": report["summary"],
+                "metadata": report["metadata"],
+                "report_file": str(report_file),
+            }
+            sys.stdout.write(json.dumps(output, indent=2, ensure_ascii=False) + "\n")
+            return
+        if args.quiet:
+            return
 
         # Pretty print results using Rich
         console = Console()
 
         # Create summary panel
-        summary_text = Text()
-        summary_text.append("Evaluation Complete!\n\n", style="bold green")
-        summary_text.append(f"Overall Success Rate: {overall_success_rate:.1%}\n", style="cyan")
-        summary_text.append(
-            f"Successful Tasks: {successful_tasks}/{total_tasks}\n", style="magenta"
+        summary_text = Text.from_markup(
+            "[bold green]Evaluation Complete![/bold green]\n\n"
+            f"[cyan]Overall Success Rate: {overall_success_rate:.1%}[/cyan]\n"
+            f"[magenta]Successful Tasks: {successful_tasks}/{total_tasks}[/magenta]\n"
+            f"[yellow]Total Duration: {total_duration:.1f} seconds[/yellow]\n"
         )
-        summary_text.append(f"Total Duration: {total_duration:.1f} seconds\n", style="yellow")
 
         summary_panel = Panel(
             summary_text,
@@ -321,13 +406,18 @@ async def execute(args: argparse.Namespace) -> None:
             results_table.add_column("Score", style="green", justify="center")
             results_table.add_column("Status", style="yellow", justify="center")
 
-            for result in task_results:
-                status = "✅ Success" if result["score"] > 0.99 else "❌ Failed"
-                status_style = "green" if result["score"] > 0.99 else "red"
+            # Only render the first rows; the full list is in the JSON report
+            for task_name, score_str, success in result_rows:
+                results_table.add_row(
+                    task_name,
+                    score_str,
+                    "[green]✅ Success[/green]" if success else "[red]❌ Failed[/red]",
+                )
+            if total_tasks > MAX_RESULT_TABLE_ROWS:
                 results_table.add_row(
-                    result.get("task_name", "Unknown"),
-                    f"{result['score']:.3f}",
-                    f"[{status_style}]{status}[/{status_style}]",
+                    f"[dim]... and {total_tasks - MAX_RESULT_TABLE_ROWS} more[/dim]",
+                    "",
+                    "",
                 )
 
             console.print(results_table)
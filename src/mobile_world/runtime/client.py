@@ -97,7 +97,7 @@ class AndroidEnvClient:
         self._ensure_initialized()
 
         if go_home:
-            self.execute_action(JSONAction(action_type=NAVIGATE_HOME))
+            self.execute_action(JSONAction.from_trusted(action_type=NAVIGATE_HOME))
 
         return Response(status="success", message="Environment reset")
 
@@ -149,12 +149,14 @@ class AndroidEnvClient:
         """Executes an action in the environment."""
         self._ensure_initialized()
 
-        logger.debug(f"Executing action: {action.model_dump_json(exclude_none=True)}")
+        # Most actions set only a handful of fields; unset ones default to None server-side
+        action_data = action.model_dump(exclude_none=True)
+        logger.debug(f"Executing action: {action_data}")
 
         # Send JSONAction directly to server
         step_data = {
             "device": self.device,
-            "action": action.model_dump(),
+            "action": action_data,
         }
 
         response = requests.post(f"{self.base_url}/step", json=step_data)
@@ -1,31 +1,160 @@
 import base64
+import functools
 import os
+import posixpath
+import re
+import select
 import shlex
+import struct
+import subprocess
+import threading
 import time
+import uuid
 from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from mobile_world.runtime.utils.helpers import (
     AdbResponse,
-    execute_adb,
+    execute_adb_argv,
     time_within_ten_secs,
 )
 from mobile_world.runtime.utils.models import APP_DICT, COMMON_APP_MAPPER
 
-APP_LOWER_DICT = {k.lower(): v for k, v in APP_DICT.items()}
-APP_LOWER_DICT.update({app_name.lower(): package_name for package_name, app_name in COMMON_APP_MAPPER.items()})
+if TYPE_CHECKING:
+    import numpy as np
+
+_FOCUS_RE = re.compile(r"mCurrentFocus=.*?\s([^/\s]+)/")
+# Non-empty, stripped lines of `emu avd snapshot list` that are not the "OK" status
+_SNAP_RE = re.compile(r"^[ \t]*(?!OK)(\S[^\r\n]*?)[ \t\r]*$", re.M)
+
+ACTIVITY_CACHE_TTL = 0.2
+SNAPSHOT_LIST_CACHE_TTL = 5.0
+SNAPSHOT_LOAD_TIMEOUT = 10.0
+# Seconds of retry budget each health-check retry buys
+HEALTH_RETRY_INTERVAL = 3.0
+
+
+@functools.cache
+def _app_lower_dict() -> MappingProxyType:
+    """Case-folded app name -> package map, built on first use rather than at import."""
+    return MappingProxyType(
+        {k.casefold(): v for k, v in APP_DICT.items()}
+        | {
+            app_name.casefold(): package_name
+            for package_name, app_name in COMMON_APP_MAPPER.items()
+        }
+    )
+
+
+class _PersistentAdbShell:
+    """A long-lived ``adb -s <device> shell`` process fed commands over stdin.
+
+    Spawning ``adb`` for every input event costs tens of milliseconds, so short device
+    commands are written to one shell instead. Each command is followed by an ``echo``
+    of a unique marker and its exit status, which frames the output on stdout.
+    """
+
+    def __init__(self, device: str, timeout: float = 30.0):
+        self.device = device
+        self.timeout = timeout
+        self._marker = f"__MW_END_{uuid.uuid4().hex}__".encode()
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                # -T: no PTY, otherwise the echoed marker line would be read as output
+                ["adb", "-s", self.device, "shell", "-T"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+        return self._proc
+
+    def _close(self) -> None:
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+                self._proc.wait(timeout=1)
+            except Exception:
+                pass
+        self._proc = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _read_response(self, proc: subprocess.Popen) -> tuple[bytes, int]:
+        fd = proc.stdout.fileno()
+        buf = b""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            idx = buf.find(self._marker)
+            if idx != -1:
+                end = buf.find(b"\n", idx)
+                if end != -1:
+                    return buf[:idx], int(buf[idx + len(self._marker) : end].strip() or 1)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("timed out waiting for adb shell output")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise EOFError("adb shell exited")
+            buf += chunk
+
+    def run(self, command: str) -> AdbResponse:
+        """Run a device shell command and return its combined stdout/stderr."""
+        display = f"adb -s {self.device} shell {command}"
+        with self._lock:
+            try:
+                proc = self._start()
+                framed = b"{ %s\n} </dev/null 2>&1; echo %s$?\n" % (command.encode(), self._marker)
+                proc.stdin.write(framed)
+            except OSError as e:
+                # The command never reached the device, so a one-shot adb call is safe
+                logger.warning(f"Persistent adb shell unavailable for {self.device}: {e}")
+                self._close()
+                return execute_adb_argv(["adb", "-s", self.device, "shell", command])
+
+            try:
+                raw, return_code = self._read_response(proc)
+            except (OSError, EOFError, TimeoutError, ValueError) as e:
+                self._close()
+                logger.error(f"Command execution failed: {display}")
+                return AdbResponse(success=False, error=str(e), return_code=-1, command=display)
+
+        output = raw.decode("utf-8", errors="replace").strip()
+        if return_code == 0:
+            return AdbResponse(success=True, output=output, command=display)
+        logger.error(f"Command execution failed: {display}")
+        logger.error(output)
+        return AdbResponse(
+            success=False,
+            error=output or "Command execution failed",
+            return_code=return_code,
+            command=display,
+        )
 
 
 class AndroidController:
     def __init__(self, device="emulator-5554"):
         self.device = device
-        self.screenshot_dir = "/sdcard"
+        self.shell = _PersistentAdbShell(device)
+        self._device_size: tuple[int, int] | None = None
+        self._activity_cache: tuple[float, str] | None = None
+        self._snapshot_cache: tuple[float, list[str]] | None = None
         self.xml_dir = "/sdcard"
         self.ac_xml_dir = "/sdcard/Android/data/com.example.android.xml_parser/files"
         self.width, self.height = self.get_device_size()
         self.viewport_size = (self.width, self.height)
-        self.backslash = "\\"
 
         self.interaction_cache = ""
         self.user_agent_chat_history = []
@@ -34,110 +163,160 @@ class AndroidController:
         self.user_sys_prompt = None
         self.model_config = None
 
+    def _adb(self, *args: str, output: bool = True) -> AdbResponse:
+        return execute_adb_argv(["adb", "-s", self.device, *args], output=output)
+
+    def close(self) -> None:
+        """Stop the persistent adb shell; it is restarted on the next shell command."""
+        self.shell.close()
+
+    def _run_input(self, command: str) -> AdbResponse:
+        """Run a shell command that may change the focused window."""
+        self._activity_cache = None
+        return self.shell.run(command)
+
     def get_device_size(self):
+        # The resolution is fixed for the lifetime of the device, so keep the first answer
+        if self._device_size is not None:
+            return self._device_size
         try:
-            command = f"adb -s {self.device} shell wm size"
-            result = execute_adb(command)
+            result = self._adb("shell", "wm", "size")
             if not result.success:
                 raise RuntimeError("Failed to get device size for device")
             resolution = result.output.split(":")[1].strip()
             width, height = resolution.split("x")
-            return int(width), int(height)
+            self._device_size = (int(width), int(height))
+            return self._device_size
         except Exception as e:
             logger.error(f"Failed to get device size for device {self.device}: {e}")
             return None, None
 
+    def get_screenshot_bytes(self) -> bytes:
+        """Capture the screen and return the raw PNG bytes without touching disk."""
+        return subprocess.run(
+            ["adb", "-s", self.device, "exec-out", "screencap", "-p"],
+            capture_output=True,
+            check=True,
+        ).stdout
+
+    def get_screenshot_numpy(self) -> "np.ndarray":
+        """Capture the screen as a read-only (height, width, 4) RGBA uint8 array.
+
+        Uses raw ``screencap`` output, skipping PNG encoding on the device and decoding
+        on the host.
+        """
+        # Imported here so the controller (and the package) does not pay for numpy at import
+        import numpy as np
+
+        raw = subprocess.run(
+            ["adb", "-s", self.device, "exec-out", "screencap"],
+            capture_output=True,
+            check=True,
+        ).stdout
+        width, height = struct.unpack_from("<II", raw)
+        # The header is 12 bytes on older Android versions and 16 (with colour space) on newer
+        header_size = len(raw) - width * height * 4
+        if header_size not in (12, 16):
+            raise ValueError(f"Unexpected raw screencap size {len(raw)} for {width}x{height}")
+        return np.frombuffer(raw, dtype=np.uint8, offset=header_size).reshape(height, width, 4)
+
     def get_screenshot(self, prefix, save_dir, try_times: int = 0) -> AdbResponse:
-        remote_path = os.path.join(self.screenshot_dir, prefix + ".png").replace(
-            self.backslash, "/"
-        )
         local_path = os.path.join(save_dir, prefix + ".png")
-
-        # try the stealth API first, otherwise screenshot
-        # may trigger events in some apps
-        stealth_command = f"adb -s {self.device} exec-out screencap -p > {local_path}"
-        stealth_result = execute_adb(stealth_command)
-        if stealth_result.success:
-            return AdbResponse(success=True, output=local_path, command=stealth_command)
-
-        cap_command = f"adb -s {self.device} shell screencap -p {remote_path}"
-        pull_command = f"adb -s {self.device} pull {remote_path} {local_path}"
-        rm_command = f"adb -s {self.device} shell rm {remote_path}"
-
-        cap_result = execute_adb(cap_command)
-        if cap_result.success:
-            result = execute_adb(pull_command)
-
-            if not result.success and try_times > 0:
-                # occasionally the pull command fails at file not found, so we try again, likely due to file not finished being written yet
-                time.sleep(1)
-                return self.get_screenshot(prefix, save_dir, try_times - 1)
-            elif not result.success and try_times <= 0:
-                execute_adb(rm_command, output=False)
-                return AdbResponse(
-                    success=False, error=result.error + cap_result.output, command=pull_command
+        command = f"adb -s {self.device} exec-out screencap -p"
+
+        # exec-out is the stealth API (shell screencap may trigger events in some apps);
+        # adb's stdout is handed the file directly, so no shell redirection or extra copy
+        delay = 0.1
+        for attempt in range(try_times + 1):
+            with open(local_path, "wb") as f:
+                result = subprocess.run(
+                    ["adb", "-s", self.device, "exec-out", "screencap", "-p"],
+                    stdout=f,
+                    stderr=subprocess.PIPE,
                 )
-            else:
-                execute_adb(rm_command, output=False)
-                return AdbResponse(success=True, output=local_path, command=pull_command)
-        return cap_result
+                written = os.fstat(f.fileno()).st_size
+            if result.returncode == 0 and written > 0:
+                return AdbResponse(success=True, output=local_path, command=command)
+            if attempt < try_times:
+                time.sleep(delay)
+                delay *= 2
+
+        error = result.stderr.decode("utf-8", errors="replace").strip()
+        logger.error(f"Command execution failed: {command}")
+        return AdbResponse(
+            success=False,
+            error=error or "Empty screenshot",
+            return_code=result.returncode,
+            command=command,
+        )
+
+    def _dump_xml(self, remote_path: str, local_path: str) -> AdbResponse:
+        # Stream the dump over exec-out so there is no on-device file to pull
+        command = f"adb -s {self.device} exec-out uiautomator dump /dev/tty"
+        result = subprocess.run(
+            ["adb", "-s", self.device, "exec-out", "uiautomator", "dump", "/dev/tty"],
+            capture_output=True,
+        )
+        end = result.stdout.rfind(b"</hierarchy>")
+        if result.returncode == 0 and end != -1:
+            # uiautomator appends "UI hierchary dumped to: /dev/tty" after the document
+            with open(local_path, "wb") as f:
+                f.write(result.stdout[: end + len(b"</hierarchy>")])
+            return AdbResponse(success=True, output=local_path, command=command)
+
+        # Some builds cannot dump to /dev/tty; dump on the device and pull instead
+        result = self._adb("shell", "uiautomator", "dump", remote_path)
+        if not result.success:
+            return result
+        return self._adb("pull", remote_path, local_path)
 
-    def get_xml(self, prefix, save_dir):
-        remote_path = os.path.join(self.xml_dir, prefix + ".xml").replace(self.backslash, "/")
+    def get_xml(self, prefix, save_dir, max_retries: int = 5):
+        remote_path = posixpath.join(self.xml_dir, f"{prefix}.xml")
         local_path = os.path.join(save_dir, prefix + ".xml")
-        dump_command = f"adb -s {self.device} shell uiautomator dump {remote_path}"
-        pull_command = f"adb -s {self.device} pull {remote_path} {local_path}"
 
         def is_file_empty(file_path):
             return os.path.exists(file_path) and os.path.getsize(file_path) == 0
 
-        for attempt in range(5):
-            result = execute_adb(dump_command)
-            if not result.success:
-                time.sleep(2)
-                continue
-
-            result = execute_adb(pull_command)
-            if not result.success or is_file_empty(local_path):
-                time.sleep(2)
-                continue
-            return local_path
-
-        # Final attempt after 3 retries
-        result = execute_adb(dump_command)
-        result = execute_adb(pull_command)
-        if result.success and not is_file_empty(local_path):
-            return local_path
+        delay = 0.3
+        for attempt in range(max_retries):
+            result = self._dump_xml(remote_path, local_path)
+            if result.success and not is_file_empty(local_path):
+                return local_path
+            if attempt < max_retries - 1:
+                time.sleep(delay)
+                delay = min(delay * 2, 2)
 
         return result
 
-    def get_ac_xml(self, prefix, save_dir):
-        remote_path = f"{os.path.join(self.ac_xml_dir, 'ui.xml').replace(self.backslash, '/')}"
+    def get_ac_xml(self, prefix, save_dir, max_retries: int = 5):
+        remote_path = posixpath.join(self.ac_xml_dir, "ui.xml")
         local_path = os.path.join(save_dir, prefix + ".xml")
-        pull_command = f"adb -s {self.device} pull {remote_path} {local_path}"
 
         def is_file_empty(file_path):
             return os.path.exists(file_path) and os.path.getsize(file_path) == 0
 
-        for _ in range(5):
-            result = execute_adb(pull_command)
+        delay = 0.3
+        for attempt in range(max_retries):
+            result = self._adb("pull", remote_path, local_path)
             if result.success and not is_file_empty(local_path):
                 return local_path
-            time.sleep(2)
-
-        # Final attempt after 3 retries
-        result = execute_adb(pull_command)
-        if result.success and not is_file_empty(local_path):
-            return local_path
+            if attempt < max_retries - 1:
+                time.sleep(delay)
+                delay = min(delay * 2, 2)
 
         return result
 
     def get_current_activity(self):
-        adb_command = "adb -s {device} shell dumpsys window | grep mCurrentFocus | awk -F '/' '{print $1}' | awk '{print $NF}'"
-        adb_command = adb_command.replace("{device}", self.device)
-        result = execute_adb(adb_command)
+        now = time.monotonic()
+        if self._activity_cache is not None and now - self._activity_cache[0] < ACTIVITY_CACHE_TTL:
+            return self._activity_cache[1]
+        # grep exits 1 when nothing has focus; that is an empty activity, not an error
+        result = self.shell.run("dumpsys window | grep mCurrentFocus || true")
         if result.success:
-            return result.output
+            match = _FOCUS_RE.search(result.output)
+            activity = match.group(1) if match else ""
+            self._activity_cache = (now, activity)
+            return activity
         return 0
 
     def get_current_app(self):
@@ -148,44 +327,31 @@ class AndroidController:
         return app
 
     def back(self) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input keyevent KEYCODE_BACK"
-        ret = execute_adb(adb_command)
-        return ret
+        return self._run_input("input keyevent KEYCODE_BACK")
 
     def enter(self) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input keyevent KEYCODE_ENTER"
-        ret = execute_adb(adb_command)
-        return ret
+        return self._run_input("input keyevent KEYCODE_ENTER")
 
     def home(self) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input keyevent KEYCODE_HOME"
-        ret = execute_adb(adb_command)
-        return ret
+        return self._run_input("input keyevent KEYCODE_HOME")
 
     def app_switch(self) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input keyevent KEYCODE_APP_SWITCH"
-        ret = execute_adb(adb_command)
-        return ret
+        return self._run_input("input keyevent KEYCODE_APP_SWITCH")
 
     def tap(self, x: int, y: int) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input tap {x} {y}"
-        ret = execute_adb(adb_command)
-        return ret
+        return self._run_input(f"input tap {x} {y}")
 
     def double_tap(self, x: int, y: int) -> AdbResponse:
-        ret = self.tap(x, y)
-        time.sleep(0.1)
-        ret = self.tap(x, y)
-        return ret
+        return self.batch_actions([f"input tap {x} {y}", "sleep 0.1", f"input tap {x} {y}"])
+
+    def batch_actions(self, actions: list[str]) -> AdbResponse:
+        """Run several device shell commands (e.g. ``input tap x y``) in one round-trip."""
+        return self._run_input("; ".join(actions))
 
     def text(self, input_str: str) -> AdbResponse:
         chars = input_str
-        charsb64 = str(base64.b64encode(chars.encode("utf-8")))[1:]
-        adb_command = (
-            f"adb -s {self.device} shell am broadcast -a ADB_INPUT_B64 --es msg {charsb64}"
-        )
-        ret = execute_adb(adb_command)
-        return ret
+        charsb64 = base64.b64encode(chars.encode("utf-8")).decode("ascii")
+        return self._run_input(f"am broadcast -a ADB_INPUT_B64 --es msg {shlex.quote(charsb64)}")
 
     def simulate_sms(self, sender: str | None, message: str | None) -> AdbResponse:
         if sender is None or message is None:
@@ -194,19 +360,15 @@ class AndroidController:
                 error="sender and message must not be None",
                 command=f"adb -s {self.device} emu sms send",
             )
-        adb_command = f"adb -s {self.device} emu sms send {shlex.quote(str(sender))} {shlex.quote(str(message))}"
-        ret = execute_adb(adb_command)
-        logger.info(f"simulate_sms command: {adb_command}")
+        ret = self._adb("emu", "sms", "send", str(sender), str(message))
+        logger.info(f"simulate_sms command: {ret.command}")
         return ret
 
     def long_press(self, x: int, y: int, duration: int = 1000) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input swipe {x} {y} {x} {y} {duration}"
-        ret = execute_adb(adb_command)
-        return ret
+        return self._run_input(f"input swipe {x} {y} {x} {y} {duration}")
 
     def kill_package(self, package_name: str) -> AdbResponse:
-        command = f"adb -s {self.device} shell am force-stop {package_name}"
-        return execute_adb(command)
+        return self._run_input(f"am force-stop {package_name}")
 
     def swipe(
         self,
@@ -239,29 +401,29 @@ class AndroidController:
                 command=f"adb -s {self.device} shell input swipe",
             )
         duration = 400
-        adb_command = f"adb -s {self.device} shell input swipe {x} {y} {x + offset[0]} {y + offset[1]} {duration}"
-        ret = execute_adb(adb_command)
-        return ret
+        return self._run_input(f"input swipe {x} {y} {x + offset[0]} {y + offset[1]} {duration}")
 
     def drag(
         self, start_x: int, start_y: int, end_x: int, end_y: int, duration: int = 400
     ) -> AdbResponse:
-        adb_command = (
-            f"adb -s {self.device} shell input swipe {start_x} {start_y} {end_x} {end_y} {duration}"
-        )
-        ret = execute_adb(adb_command)
-        return ret
+        return self._run_input(f"input swipe {start_x} {start_y} {end_x} {end_y} {duration}")
 
     def launch_app(self, app_name: str) -> AdbResponse:
         command = None
 
-        if app_name.lower() in APP_LOWER_DICT:
-            command = f"adb -s {self.device} shell monkey -p {APP_LOWER_DICT[app_name.lower()]} -c android.intent.category.LAUNCHER 1"
-            ret = execute_adb(command)
+        package_name = _app_lower_dict().get(app_name.casefold())
+        if package_name is not None:
+            self._activity_cache = None
+            ret = self._adb(
+                "shell", "monkey", "-p", package_name, "-c", "android.intent.category.LAUNCHER", "1"
+            )
             if ret.success:
                 return ret
-        logger.warning(
-            f"Failed to launch the app: {app_name}. Available app list: {list(APP_LOWER_DICT.keys())}"
+            command = ret.command
+        logger.opt(lazy=True).warning(
+            "Failed to launch the app: {}. Available app list: {}",
+            lambda: app_name,
+            lambda: list(_app_lower_dict()),
         )
         return AdbResponse(
             success=False,
@@ -310,12 +472,13 @@ class AndroidController:
 
     def check_ac_survive(self):
         try:
-            time_command = f"adb -s {self.device} shell stat -c %y /sdcard/Android/data/com.example.android.xml_parser/files/ui.xml"
-            time_phone_command = f'adb -s {self.device} shell date +"%H:%M:%S"'
-            result = time_within_ten_secs(
-                execute_adb(time_command),
-                execute_adb(time_phone_command),
-            )
+            # One round-trip for both the dump's mtime and the device clock
+            ui_xml = posixpath.join(self.ac_xml_dir, "ui.xml")
+            response = self.shell.run(f'stat -c %y {ui_xml} && date +"%H:%M:%S"')
+            if not response.success:
+                return False
+            file_time, phone_time = response.output.splitlines()[-2:]
+            result = time_within_ten_secs(file_time.strip(), phone_time.strip())
         except Exception as e:
             print(e)
             return False
@@ -323,23 +486,20 @@ class AndroidController:
 
     def list_snapshots(self):
         """List all available snapshots for the emulator"""
+        now = time.monotonic()
+        cached = self._snapshot_cache
+        if cached is not None and now - cached[0] < SNAPSHOT_LIST_CACHE_TTL:
+            return list(cached[1])
         try:
-            adb_command = f"adb -s {self.device} emu avd snapshot list"
-            result = execute_adb(adb_command)
+            result = self._adb("emu", "avd", "snapshot", "list")
 
             if not result.success:
                 logger.error(f"Failed to list snapshots: {result.error}")
                 return []
 
-            # Parse snapshot names from response
-            snapshots = []
-            lines = result.output.split("\n")
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith("OK") and line != "":
-                    snapshots.append(line)
-
-            return snapshots
+            snapshots = _SNAP_RE.findall(result.output)
+            self._snapshot_cache = (now, snapshots)
+            return list(snapshots)
         except Exception as e:
             logger.error(f"Failed to list snapshots: {e}")
             return []
@@ -347,8 +507,8 @@ class AndroidController:
     def delete_snapshot(self, tag):
         """Delete a snapshot with the given tag"""
         try:
-            adb_command = f"adb -s {self.device} emu avd snapshot delete {tag}"
-            result = execute_adb(adb_command)
+            result = self._adb("emu", "avd", "snapshot", "delete", tag)
+            self._snapshot_cache = None
 
             if result.success and "OK" in result.output:
                 logger.info(f"Successfully deleted snapshot: {tag}")
@@ -368,8 +528,8 @@ class AndroidController:
             if tag is None:
                 tag = f"snapshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-            adb_command = f"adb -s {self.device} emu avd snapshot save {tag}"
-            result = execute_adb(adb_command)
+            result = self._adb("emu", "avd", "snapshot", "save", tag)
+            self._snapshot_cache = None
 
             if result.success and "OK" in result.output:
                 logger.info(f"Successfully created snapshot: {tag}")
@@ -386,13 +546,21 @@ class AndroidController:
     def load_snapshot(self, tag):
         """Load a snapshot with the given tag"""
         try:
-            adb_command = f"adb -s {self.device} emu avd snapshot load {tag}"
-            result = execute_adb(adb_command)
+            result = self._adb("emu", "avd", "snapshot", "load", tag)
+            self._activity_cache = None
 
             if result.success and "OK" in result.output:
                 logger.info(f"Successfully loaded snapshot: {tag}")
-                # Wait a moment for the snapshot to fully load
-                time.sleep(3)
+                # Wait for the restored device to report healthy instead of a blind sleep
+                deadline = time.monotonic() + SNAPSHOT_LOAD_TIMEOUT
+                while time.monotonic() < deadline:
+                    # Failed probes are expected while adb reconnects, so poll quietly
+                    if self._is_booted(log_failures=False):
+                        return True
+                    time.sleep(0.1)
+                logger.warning(
+                    f"Device {self.device} not healthy {SNAPSHOT_LOAD_TIMEOUT}s after loading {tag}"
+                )
                 return True
             else:
                 logger.error(
@@ -404,30 +572,39 @@ class AndroidController:
             return False
 
     def activate_adb_keyboard(self):
-        execute_adb("adb shell ime set com.android.adbkeyboard/.AdbIME")
+        self._adb("shell", "ime", "set", "com.android.adbkeyboard/.AdbIME")
 
-    def check_health(self, try_times: int = 0) -> bool:
+    def _is_booted(self, log_failures: bool = True) -> bool:
         try:
-            adb_command = f"adb -s {self.device} shell getprop sys.boot_completed"
-            result = execute_adb(adb_command, output=False)
-
-            if not result.success or not result.output:
-                logger.error(f"Health check failed for device {self.device}: {result.error}")
-                if try_times > 0:
-                    time.sleep(3)
-                    return self.check_health(try_times - 1)
-                else:
-                    return False
-
-            # Boot completed should return "1"
-            if result.output.strip() == "1":
-                return True
-
-            return False
+            result = self._adb("shell", "getprop", "sys.boot_completed", output=False)
         except Exception as e:
-            logger.error(f"Health check failed for device {self.device}: {e}")
+            if log_failures:
+                logger.error(f"Health check failed for device {self.device}: {e}")
             return False
 
+        # Boot completed should return "1"
+        if result.success and result.output.strip() == "1":
+            return True
+        if log_failures and (not result.success or not result.output):
+            logger.error(f"Health check failed for device {self.device}: {result.error}")
+        return False
+
+    def check_health(self, try_times: int = 0) -> bool:
+        """Probe the device, retrying for up to ``try_times * HEALTH_RETRY_INTERVAL`` seconds.
+
+        Retries start quickly and back off exponentially, so a briefly unresponsive
+        device is picked up early without shortening the overall retry budget.
+        """
+        deadline = time.monotonic() + try_times * HEALTH_RETRY_INTERVAL
+        delay = 0.2
+        while not self._is_booted():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, HEALTH_RETRY_INTERVAL)
+        return True
+
     def push_file(self, local_path: str, remote_path: str) -> AdbResponse:
         """
         Push a file from local system to Android device.
@@ -439,8 +616,7 @@ class AndroidController:
         Returns:
             AdbResponse with remote_path in output if successful
         """
-        push_command = f"adb -s {self.device} push {local_path} {remote_path}"
-        result = execute_adb(push_command)
+        result = self._adb("push", local_path, remote_path)
 
         if result.success:
             logger.info(f"Successfully pushed file: {local_path} -> {remote_path}")
@@ -463,8 +639,7 @@ class AndroidController:
         Returns:
             AdbResponse with local_path in output if successful
         """
-        pull_command = f"adb -s {self.device} pull {remote_path} {local_path}"
-        result = execute_adb(pull_command)
+        result = self._adb("pull", remote_path, local_path)
 
         if result.success:
             logger.info(f"Successfully pulled file: {remote_path} -> {local_path}")
@@ -486,8 +661,7 @@ class AndroidController:
         Returns:
             Result of the command execution
         """
-        remove_command = f"adb -s {self.device} shell rm {remote_path}"
-        result = execute_adb(remove_command)
+        result = self._adb("shell", "rm", remote_path)
 
         if result.success:
             logger.info(f"Successfully removed file: {remote_path}")
@@ -506,12 +680,15 @@ class AndroidController:
         Returns:
             Result of the command execution
         """
-        scan_command = (
-            f"adb -s {self.device} shell am broadcast "
-            f"-a android.intent.action.MEDIA_SCANNER_SCAN_FILE "
-            f"-d file://{file_path}"
+        result = self._adb(
+            "shell",
+            "am",
+            "broadcast",
+            "-a",
+            "android.intent.action.MEDIA_SCANNER_SCAN_FILE",
+            "-d",
+            f"file://{file_path}",
         )
-        result = execute_adb(scan_command)
 
         if result.success:
             logger.info(f"Successfully triggered media scan for: {file_path}")
@@ -1,9 +1,9 @@
 """MCP server for MobileWorld controller operations."""
 
 import asyncio
-import concurrent.futures
 import os
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Coroutine
 from threading import Lock
 from typing import Any
 
@@ -47,16 +47,34 @@ MCP_CONFIG = {
 }
 CLIENT = None
 client_lock = Lock()
+# Max in-flight tool calls per MCP server
+MAX_CONCURRENT_CALLS_PER_SERVER = 8
+
+# Single event loop shared by all MCP clients, run forever in a daemon thread
+_LOOP: asyncio.AbstractEventLoop | None = None
+_loop_lock = Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    with _loop_lock:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="mcp-loop", daemon=True).start()
+        return _LOOP
 
 
 class SyncMCPClient:
     """MCP client with sync interface. Uses persistent connection for stdio transports."""
 
-    def __init__(self, url: str | None = None, config: dict | None = None,
-            max_retries: int = 5,
-            retry_delay: float = 10,
-            retry_backoff: float = 2
-        ):
+    def __init__(
+        self,
+        url: str | None = None,
+        config: dict | None = None,
+        max_retries: int = 5,
+        retry_delay: float = 10,
+        retry_backoff: float = 2,
+    ):
         self.url = url
         self.config = config
         self.tools: list[dict[str, Any]] | None = None
@@ -64,33 +82,74 @@ class SyncMCPClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.retry_backoff = retry_backoff
-        
+
         self.timeout = 120
 
         self.client = Client(config) if config else None
 
-    async def list_tools(self) -> list[dict[str, Any]]:
+        # The client connection is bound to the event loop it was opened on, so all
+        # coroutines run on the shared module loop and the connection is kept open
+        self._connect_lock = asyncio.Lock()
+        self._connected = False
+        # Only touched by coroutines on the shared loop: the public coroutines hop there
+        # via _on_shared_loop and the sync wrappers submit to it, so no lock is needed
+        self._server_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _server_semaphore(self, tool_name: str) -> asyncio.Semaphore:
+        # Multi-server clients expose tools as "<server>_<tool>"
+        server = tool_name.split("_", 1)[0]
+        semaphore = self._server_semaphores.get(server)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS_PER_SERVER)
+            self._server_semaphores[server] = semaphore
+        return semaphore
+
+    async def _connect(self) -> None:
+        async with self._connect_lock:
+            if not self._connected:
+                await self.client.__aenter__()
+                self._connected = True
+
+    async def aclose(self) -> None:
+        await self._on_shared_loop(self._aclose())
+
+    async def _aclose(self) -> None:
+        async with self._connect_lock:
+            if not self._connected:
+                return
+            self._connected = False
+            try:
+                await self.client.__aexit__(None, None, None)
+            except Exception as e:
+                logger.debug(f"Error while closing MCP client: {e}")
+
+    async def _reset_if_disconnected(self) -> None:
+        # RPC failures leave the session usable; only reconnect once the transport is gone
+        if self._connected and not self.client.is_connected():
+            await self._aclose()
+
+    async def _list_tools_impl(self) -> list[dict[str, Any]]:
         if not self.client:
             return []
         last_exception = None
         delay = self.retry_delay
         for attempt in range(self.max_retries):
             try:
-                async with self.client:
-                    tools_result = await asyncio.wait_for(
-                        self.client.list_tools(),
-                        timeout=self.timeout
-                    )
-                    result = [t.model_dump() for t in tools_result]
-                    if not result or len(result) == 0:
-                        raise ValueError("Empty tools list returned")
-                    logger.info(f"Successfully listed {len(result)} tools on attempt {attempt + 1}")
-                    return result
+                await self._connect()
+                tools_result = await asyncio.wait_for(
+                    self.client.list_tools(), timeout=self.timeout
+                )
+                result = [t.model_dump() for t in tools_result]
+                if not result or len(result) == 0:
+                    raise ValueError("Empty tools list returned")
+                logger.info(f"Successfully listed {len(result)} tools on attempt {attempt + 1}")
+                return result
             except Exception as e:
                 last_exception = e
                 logger.warning(
                     f"Failed to list tools (attempt {attempt + 1}/{self.max_retries}): {e}"
                 )
+                await self._reset_if_disconnected()
             if attempt < self.max_retries - 1:
                 logger.info(f"Retrying in {delay} seconds...")
                 await asyncio.sleep(delay)
@@ -100,65 +159,84 @@ class SyncMCPClient:
         return []
 
     def _run_async_func(self, func: Callable[..., Any]) -> Any:
-        try:
-            asyncio.get_running_loop()
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, func())
-                return future.result()
-        except RuntimeError:
-            return asyncio.run(func())
+        return asyncio.run_coroutine_threadsafe(func(), _get_loop()).result()
+
+    async def _on_shared_loop(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        # Callers may await from any loop (e.g. asyncio.run in task evaluation), but the
+        # connection and its locks belong to the shared loop, so hop there first
+        loop = _get_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return await self._on_shared_loop(self._list_tools_impl())
 
     def list_tools_sync(self) -> list[dict[str, Any]]:
         with client_lock:
             if self.tools is not None:
                 return self.tools
-            self.tools = self._run_async_func(self.list_tools)
+            self.tools = self._run_async_func(self._list_tools_impl)
             return self.tools
 
-    async def call_tool(
+    async def _call_tool_impl(
         self,
         name: str,
         arguments: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         last_exception = None
         delay = self.retry_delay
-        
+
         for attempt in range(self.max_retries):
             try:
                 if self.client:
-                    async with self.client:
-                        result_content = await self.client.call_tool(name, arguments, timeout=self.timeout)
-                        result = [t.model_dump() for t in result_content]
-                        if not result or len(result) == 0:
-                            raise ValueError(f"Empty result from tool {name}")
-                        logger.info(f"Successfully called tool {name} on attempt {attempt + 1}")
-                        return result
+                    await self._connect()
+                    async with self._server_semaphore(name):
+                        result_content = await self.client.call_tool(
+                            name, arguments, timeout=self.timeout
+                        )
+                    result = [t.model_dump() for t in result_content]
+                    if not result or len(result) == 0:
+                        raise ValueError(f"Empty result from tool {name}")
+                    logger.info(f"Successfully called tool {name} on attempt {attempt + 1}")
+                    return result
                 else:
                     raise ValueError("No client configured")
-                    
+
             except Exception as e:
                 last_exception = e
                 logger.warning(
                     f"Failed to call tool {name} (attempt {attempt + 1}/{self.max_retries}): {e}"
                 )
+                if self.client:
+                    await self._reset_if_disconnected()
                 if attempt < self.max_retries - 1:
                     logger.info(f"Retrying in {delay} seconds...")
                     await asyncio.sleep(delay)
                     delay *= self.retry_backoff
-        error_msg = f"Failed to call tool {name} after {self.max_retries} attempts: {last_exception}"
+        error_msg = (
+            f"Failed to call tool {name} after {self.max_retries} attempts: {last_exception}"
+        )
         logger.error(error_msg)
         return {"result": error_msg}
 
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return await self._on_shared_loop(self._call_tool_impl(name, arguments))
+
     def call_tool_sync(
         self,
         name: str,
         arguments: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        with client_lock:
-            return self._run_async_func(lambda: self.call_tool(name, arguments))
+        return self._run_async_func(lambda: self._call_tool_impl(name, arguments))
 
 
 def init_mcp_clients() -> SyncMCPClient:
+    _get_loop()
     with client_lock:
         global CLIENT
         if CLIENT is None:
@@ -82,11 +82,17 @@ def _log_docker_permission_help() -> None:
     logger.error("     $ sudo systemctl status docker")
 
 
-def docker_ps(include_all: bool = False) -> list[dict[str, Any]]:
-    """Return a list of containers from `docker ps` as dicts."""
+def docker_ps(include_all: bool = False, running_only: bool = False) -> list[dict[str, Any]]:
+    """Return a list of containers from `docker ps` as dicts.
+
+    When ``running_only`` is set, filtering happens on the Docker side via
+    ``--filter status=running`` so stopped/paused containers are never sent back.
+    """
     cmd = ["docker", "ps", "--format", "{{json .}}"]
     if include_all:
         cmd.insert(2, "-a")
+    if running_only:
+        cmd[2:2] = ["--filter", "status=running"]
     result = run_command(cmd)
     containers: list[dict[str, Any]] = []
     for line in (result.stdout or "").strip().split("\n"):
@@ -100,12 +106,14 @@ def docker_ps(include_all: bool = False) -> list[dict[str, Any]]:
 
 
 def list_containers_by_image_substring(
-    image_substring: str, *, include_all: bool = False
+    image_substring: str, *, include_all: bool = False, running_only: bool = False
 ) -> list[dict[str, Any]]:
     """Filter `docker ps` by image substring (case-insensitive)."""
     substring = (image_substring or "").lower()
     return [
-        c for c in docker_ps(include_all=include_all) if substring in (c.get("Image", "").lower())
+        c
+        for c in docker_ps(include_all=include_all, running_only=running_only)
+        if substring in (c.get("Image", "").lower())
     ]
 
 
@@ -1,6 +1,7 @@
 import copy
 import json
 import os
+import shlex
 import subprocess
 from datetime import datetime, timedelta
 
@@ -154,6 +155,18 @@ def execute_adb(adb_command: str, output: bool = True, root_required=False) -> A
         text=True,
         env=env,
     )
+    return _to_adb_response(result, adb_command, output)
+
+
+def execute_adb_argv(argv: list[str], output: bool = True) -> AdbResponse:
+    """Run an adb command given as an argument list, without an intermediate shell."""
+    result = subprocess.run(argv, capture_output=True, text=True)
+    return _to_adb_response(result, shlex.join(argv), output)
+
+
+def _to_adb_response(
+    result: subprocess.CompletedProcess, adb_command: str, output: bool
+) -> AdbResponse:
     if result.returncode == 0:
         return AdbResponse(
             success=True,
@@ -1,9 +1,13 @@
 # models.py
 """Pydantic models for FastAPI server requests and responses."""
 
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Any, Literal
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, field_validator, model_validator
 
 # Action type constants
 ANSWER = "answer"
@@ -27,28 +31,31 @@ MCP = "mcp"
 ENV_FAIL = "error_env"
 DEFAULT_IMAGE = "ghcr.io/tongyi-mai/mobile_world:latest"
 DEFAULT_NAME_PREFIX = "mobile_world_env"
-_ACTION_TYPES = (
-    CLICK,
-    DOUBLE_TAP,
-    SCROLL,
-    SWIPE,
-    INPUT_TEXT,
-    NAVIGATE_HOME,
-    NAVIGATE_BACK,
-    KEYBOARD_ENTER,
-    OPEN_APP,
-    STATUS,
-    WAIT,
-    LONG_PRESS,
-    ANSWER,
-    FINISHED,
-    UNKNOWN,
-    DRAG,
-    ASK_USER,
-    MCP,
+_ACTION_TYPES = frozenset(
+    {
+        CLICK,
+        DOUBLE_TAP,
+        SCROLL,
+        SWIPE,
+        INPUT_TEXT,
+        NAVIGATE_HOME,
+        NAVIGATE_BACK,
+        KEYBOARD_ENTER,
+        OPEN_APP,
+        STATUS,
+        WAIT,
+        LONG_PRESS,
+        ANSWER,
+        FINISHED,
+        UNKNOWN,
+        DRAG,
+        ASK_USER,
+        MCP,
+        ENV_FAIL,
+    }
 )
 
-_SCROLL_DIRECTIONS = ("left", "right", "down", "up")
+_SCROLL_DIRECTIONS = frozenset({"left", "right", "down", "up"})
 
 # Keys of JSON action
 ACTION_TYPE = "action_type"
@@ -63,7 +70,7 @@ START_X = "start_x"
 START_Y = "start_y"
 END_X = "end_x"
 END_Y = "end_y"
-ACTION_KEYS = [
+ACTION_KEYS = (
     ACTION_TYPE,
     INDEX,
     X,
@@ -76,7 +83,7 @@ ACTION_KEYS = [
     START_Y,
     END_X,
     END_Y,
-]
+)
 
 
 class JSONAction(BaseModel):
@@ -172,11 +179,23 @@ class JSONAction(BaseModel):
             raise ValueError(f"Invalid keycode: {v}")
         return v
 
-    def model_post_init(self, __context: Any) -> None:
-        """Additional validation after model initialization."""
-        if self.index is not None:
-            if self.x is not None or self.y is not None:
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "JSONAction":
+        """Build an action from values produced by our own code, skipping validation.
+
+        Anything parsed from model output or request bodies should still go through
+        ``JSONAction(**data)``.
+        """
+        return cls.model_construct(**data)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _check_exclusive(cls, data: Any) -> Any:
+        """Reject an index combined with <x, y> before any field is coerced."""
+        if isinstance(data, dict) and data.get(INDEX) is not None:
+            if data.get(X) is not None or data.get(Y) is not None:
                 raise ValueError("Either an index or a <x, y> should be provided.")
+        return data
 
     def __eq__(self, other: object) -> bool:
         """Compare two JSONActions."""
@@ -189,6 +208,51 @@ class JSONAction(BaseModel):
         return not self.__eq__(other)
 
 
+_EQ_FIELDS = (
+    ACTION_TYPE,
+    INDEX,
+    X,
+    Y,
+    "keycode",
+    DIRECTION,
+    GOAL_STATUS,
+    START_X,
+    START_Y,
+    END_X,
+    END_Y,
+)
+
+
+def _make_fields_comparator(fields: tuple[str, ...]) -> Callable[[Any, Any], bool]:
+    """Generate a straight-line ``a.f == b.f and ...`` comparator over ``fields``.
+
+    Unlike comparing attrgetter tuples, the generated function stops at the first
+    mismatching field, which is the common case when diffing trajectories.
+    """
+    body = " and ".join(f"a.{field} == b.{field}" for field in fields)
+    namespace: dict[str, Any] = {}
+    exec(f"def _compare_fields(a, b):\n    return {body}\n", namespace)
+    return namespace["_compare_fields"]
+
+
+_compare_eq_fields = _make_fields_comparator(_EQ_FIELDS)
+
+
+def ieq(x: str | None, y: str | None) -> bool:
+    """Case-insensitive equality for optional strings.
+
+    ASCII strings of different lengths cannot match, so they are rejected without
+    allocating lowered copies.
+    """
+    if x is y:
+        return True
+    if x is None or y is None:
+        return False
+    if len(x) != len(y) and x.isascii() and y.isascii():
+        return False
+    return x.lower() == y.lower()
+
+
 def _compare_actions(a: JSONAction, b: JSONAction) -> bool:
     """Compares two JSONActions.
 
@@ -199,36 +263,11 @@ def _compare_actions(a: JSONAction, b: JSONAction) -> bool:
     Returns:
         If the actions are equal.
     """
-    # Ignore cases for app_name and text.
-    if a.app_name is not None and b.app_name is not None:
-        app_name_match = a.app_name.lower() == b.app_name.lower()
-    else:
-        app_name_match = a.app_name == b.app_name
-
-    if a.text is not None and b.text is not None:
-        text_match = a.text.lower() == b.text.lower()
-    else:
-        text_match = a.text == b.text
-
-    # Compare the non-metadata fields.
-    return (
-        app_name_match
-        and text_match
-        and a.action_type == b.action_type
-        and a.index == b.index
-        and a.x == b.x
-        and a.y == b.y
-        and a.keycode == b.keycode
-        and a.direction == b.direction
-        and a.goal_status == b.goal_status
-        and a.start_x == b.start_x
-        and a.start_y == b.start_y
-        and a.end_x == b.end_x
-        and a.end_y == b.end_y
-    )
-
-
-APP_DICT = {
+    # Ignore cases for app_name and text; compare the other non-metadata fields exactly.
+    return _compare_eq_fields(a, b) and ieq(a.app_name, b.app_name) and ieq(a.text, b.text)
+
+
+_APP_DICT = {
     "桌面": "com.google.android.apps.nexuslauncher",
     "Contacts": "com.google.android.contacts",
     "Settings": "com.android.settings",
@@ -247,8 +286,9 @@ APP_DICT = {
     "SMS": "com.google.android.apps.messaging",
     "Camera": "com.android.camera2",
 }
+APP_DICT: Mapping[str, str] = MappingProxyType(_APP_DICT)
 
-COMMON_APP_MAPPER = {
+_COMMON_APP_MAPPER = {
     "com.quark.browser": "夸克",
     "com.mattermost.rn": "Mattermost",
     "com.google.android.apps.labs.language.tailwind": "NotebookLM",
@@ -418,6 +458,7 @@ COMMON_APP_MAPPER = {
     "com.zhiliaoapp.musically": "TikTok",
     "org.videolan.vlc": "VLC",
 }
+COMMON_APP_MAPPER: Mapping[str, str] = MappingProxyType(_COMMON_APP_MAPPER)
 
 
 # FastAPI Server Models
@@ -486,7 +527,8 @@ class Observation(BaseModel):
 
 
 # Environment/Docker Models
-class ContainerInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ContainerInfo:
     """Information about a Docker container."""
 
     name: str
@@ -500,7 +542,8 @@ class ContainerInfo(BaseModel):
     adb_port: int | None = None
 
 
-class ContainerConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ContainerConfig:
     """Configuration for launching a container."""
 
     name: str
@@ -515,7 +558,8 @@ class ContainerConfig(BaseModel):
     dev_src_path: Any | None = None  # Path
 
 
-class LaunchResult(BaseModel):
+@dataclass(slots=True)
+class LaunchResult:
     """Result of launching a container."""
 
     name: str
@@ -528,7 +572,8 @@ class LaunchResult(BaseModel):
     error_message: str | None = None
 
 
-class PrerequisiteCheckResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PrerequisiteCheckResult:
     """Result of a single prerequisite check."""
 
     name: str
@@ -537,6 +582,9 @@ class PrerequisiteCheckResult(BaseModel):
     details: str | None = None
 
 
+_get_passed = attrgetter("passed")
+
+
 class PrerequisiteCheckResults(BaseModel):
     """Results of all prerequisite checks."""
 
@@ -545,20 +593,21 @@ class PrerequisiteCheckResults(BaseModel):
     @property
     def all_passed(self) -> bool:
         """Return True if all checks passed."""
-        return all(c.passed for c in self.checks)
+        return all(map(_get_passed, self.checks))
 
     @property
     def passed_count(self) -> int:
         """Return count of passed checks."""
-        return sum(1 for c in self.checks if c.passed)
+        return sum(map(_get_passed, self.checks))
 
     @property
     def failed_count(self) -> int:
         """Return count of failed checks."""
-        return sum(1 for c in self.checks if not c.passed)
+        return len(self.checks) - self.passed_count
 
 
-class ImageStatus(BaseModel):
+@dataclass(slots=True)
+class ImageStatus:
     """Status of a Docker image."""
 
     image: str
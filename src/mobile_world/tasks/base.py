@@ -4,6 +4,7 @@ import abc
 import asyncio
 import os
 import time
+from collections.abc import Set
 from datetime import datetime
 from typing import Any
 
@@ -37,9 +38,9 @@ class BaseTask(abc.ABC):
             self.current_date = "2025-10-16"
 
     @property
-    def task_tags(self) -> set[str]:
+    def task_tags(self) -> Set[str]:
         """The tags of the task."""
-        return set()
+        return frozenset()
 
     @property
     def name(self) -> str:
@@ -48,7 +49,7 @@ class BaseTask(abc.ABC):
 
     @property
     @abc.abstractmethod
-    def app_names(self) -> set[str]:
+    def app_names(self) -> Set[str]:
         """The names of the apps that the agent will be interacting with during the task."""
 
     @property
@@ -174,15 +175,13 @@ class BaseTask(abc.ABC):
             return self.is_successful(controller)
 
     async def is_successful_async(self, controller: AndroidController) -> float | tuple[float, str]:
-        """Determines if the task is successful asynchronously."""
-        # If subclass overrode this method, just use it
-        if type(self).is_successful_async is not BaseTask.is_successful_async:
-            # subclass provided its own async implementation
-            return await self._is_successful_async_impl(controller)
+        """Determines if the task is successful asynchronously.
 
-        # Fallback: run sync implementation in a thread so we don't block the event loop
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.is_successful, controller)
+        Tasks with async checks override this; the default runs the synchronous
+        ``is_successful`` in a worker thread so several checks can be awaited together
+        (e.g. with ``asyncio.gather``) without blocking the event loop.
+        """
+        return await asyncio.to_thread(self.is_successful, controller)
 
     def tear_down(self, controller: AndroidController) -> None:  # pylint: disable=unused-argument
         """Tears down the task."""
@@ -199,20 +198,22 @@ class BaseTask(abc.ABC):
         from mobile_world.tasks.utils import wait_for_execution
 
         controller = AndroidController(device="emulator-5554")
+        try:
+            print("Initializing task...")
+            status = self.initialize_task(controller)
+            print(f"Initialize Status: {status}")
 
-        print("Initializing task...")
-        status = self.initialize_task(controller)
-        print(f"Initialize Status: {status}")
-
-        if agent_question:
-            answer = controller.ask_user(agent_question)
-            print(f"Agent Question: {agent_question}")
-            print(f"Answer: {answer}")
+            if agent_question:
+                answer = controller.ask_user(agent_question)
+                print(f"Agent Question: {agent_question}")
+                print(f"Answer: {answer}")
 
-        wait_for_execution(controller)
+            wait_for_execution(controller)
 
-        score = self.is_successful(controller)
-        print(f"Final Success Score: {score}")
+            score = self.is_successful(controller)
+            print(f"Final Success Score: {score}")
 
-        status = self.tear_down(controller)
-        print(f"Tear down Status: {status}")
+            status = self.tear_down(controller)
+            print(f"Tear down Status: {status}")
+        finally:
+            controller.close()
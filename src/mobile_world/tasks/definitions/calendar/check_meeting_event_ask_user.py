@@ -4,21 +4,22 @@ from loguru import logger
 
 from mobile_world.runtime.app_helpers.mail import get_sent_email_info
 from mobile_world.runtime.controller import AndroidController
+from mobile_world.runtime.utils.models import ieq
 from mobile_world.tasks.base import BaseTask
 
 
 class CheckMeetingEventAskUserTask(BaseTask):
     """Check calendar for meeting events and email to ask if it can be canceled."""
 
-    task_tags = {"agent-user-interaction", "lang-en"}
+    task_tags = frozenset({"agent-user-interaction", "lang-en"})
 
     goal = "Check next week's schedule. If there is a meeting with someone, email them to ask if it can be canceled."
 
     # Contact information from the provided image
     correct_recipient = "sam.smith@gmail.com"  # Sam Smith's email
     contact_name = "Sam Smith"
-    
-    app_names = {"Calendar", "Mail", "Contacts"}
+
+    app_names = frozenset({"Calendar", "Mail", "Contacts"})
 
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         self.relevant_information = (
@@ -36,11 +37,11 @@ class CheckMeetingEventAskUserTask(BaseTask):
             logger.info("No email found")
             return 0.0, "No email found"
 
-        email_to = email.get("to", "").lower()
-        expected_recipient = self.correct_recipient.lower()
-        message_content = email.get("body", "").lower()
+        email_to = email.get("to") or ""
+        expected_recipient = self.correct_recipient
+        message_content = email.get("body") or ""
 
-        if email_to == expected_recipient and len(message_content) > 0:
+        if ieq(email_to, expected_recipient) and len(message_content) > 0:
             logger.info(f"Successfully found email sent to {self.correct_recipient}")
             return 1.0, "Success"
         else:
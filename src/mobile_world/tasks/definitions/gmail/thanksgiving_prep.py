@@ -1,8 +1,7 @@
 """Thanksgiving prep task involving chrome search, email send, calendar configuraiton."""
 
-import datetime
+from operator import itemgetter
 
-import pytz
 from loguru import logger
 
 from mobile_world.runtime.app_helpers.fossify_calendar import get_calendar_events
@@ -11,6 +10,9 @@ from mobile_world.runtime.app_helpers.system import reset_chrome
 from mobile_world.runtime.controller import AndroidController
 from mobile_world.tasks.base import BaseTask
 
+_THANKSGIVING_SHOPPING_TS = 1763625600  # 2025-11-20 08:00 UTC
+_get_email_fields = itemgetter("to", "attachments", "subject", "body")
+
 
 class ThanksgivingPrepTask(BaseTask):
     goal = (
@@ -19,9 +21,11 @@ class ThanksgivingPrepTask(BaseTask):
         "Then, set an 8 am calendar event titled 'Thanksgiving Shopping' one week before Thanksgiving 2025."
     )
 
-    task_tags = {"lang-en"}
+    task_tags = frozenset({"lang-en"})
+
+    app_names = frozenset({"Mail", "Chrome", "Calendar"})
 
-    app_names = {"Mail", "Chrome", "Calendar"}
+    _meet_title = "Thanksgiving Shopping"
 
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         reset_chrome(controller)
@@ -34,17 +38,14 @@ class ThanksgivingPrepTask(BaseTask):
         email_info = get_sent_email_info()
         if email_info is None:
             return 0.0, "No email found"
-        recipients = email_info["to"]
-        attachments = email_info["attachments"]
-        subject = email_info["subject"]
-        body = email_info["body"]
+        recipients, attachments, subject, body = _get_email_fields(email_info)
         ingredients = {"sugar", "corn syrup", "vanilla"}
 
         if len(attachments) == 0 and subject == "Pie shopping" and recipients == "user@gmail.com":
-            for ingredient in ingredients:
-                if ingredient not in body.lower():
-                    logger.info("Incorrect email")
-                    return 0.0, "incorrect email"
+            body_lower = body.lower()
+            if not all(ingredient in body_lower for ingredient in ingredients):
+                logger.info("Incorrect email")
+                return 0.0, "incorrect email"
 
             logger.info("Correct email sent")
         else:
@@ -53,15 +54,9 @@ class ThanksgivingPrepTask(BaseTask):
 
         # Check calendar
         calendar_info = get_calendar_events()
-        time_zone = pytz.timezone("UTC")
-        meet_time = time_zone.localize(datetime.datetime(2025, 11, 20, 8, 0, 0))
-        meet_title = "Thanksgiving Shopping"
-        start_ts = int(meet_time.timestamp())
-
-        for event in calendar_info:
-            if event["title"] == meet_title:
-                if event["start_ts"] == start_ts:
-                    return 1.0, "success"
+        events = {(event["title"], event["start_ts"]) for event in calendar_info}
+        if (self._meet_title, _THANKSGIVING_SHOPPING_TS) in events:
+            return 1.0, "success"
 
         logger.info("Incorrect calendar event")
         return 0.0, "incorrect calendar event"
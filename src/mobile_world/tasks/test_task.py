@@ -37,7 +37,10 @@ def main():
 
     task = registry.get_task(args.task)
     controller = AndroidController(device=args.device)
-    task.run_task(controller=controller, agent_question=args.question)
+    try:
+        task.run_task(controller=controller, agent_question=args.question)
+    finally:
+        controller.close()
 
 
 if __name__ == "__main__":